@@ -82,6 +82,7 @@ def test_plugin_widgets(monkeypatch, napari_plugin_manager):
 def test_plugin_widgets_menus(test_plugin_widgets, make_napari_viewer):
     """Test the plugin widgets get added to the window menu correctly."""
     viewer = make_napari_viewer()
+    viewer.window.plugins_menu._ensure_built()
     # only take the plugin actions
     actions = viewer.window.plugins_menu.actions()
     for cnt, action in enumerate(actions):
@@ -103,9 +104,56 @@ def test_plugin_widgets_menus(test_plugin_widgets, make_napari_viewer):
     assert not actions[2].menu()
 
 
+def test_plugin_widgets_menus_mixed(
+    monkeypatch, napari_plugin_manager, make_napari_viewer
+):
+    """Test plugins providing both dock and function widgets."""
+    dock_widgets = {
+        "Mixed": {"W1": (Widg1, {})},
+        "Both": {"W1": (Widg1, {}), "W2": (Widg2, {})},
+    }
+    monkeypatch.setattr(napari_plugin_manager, "_dock_widgets", dock_widgets)
+    function_widgets = {
+        "Mixed": {'f1': magicfunc, 'f2': magicfunc},
+        "Both": {'f1': magicfunc, 'f2': magicfunc},
+    }
+    monkeypatch.setattr(
+        napari_plugin_manager, "_function_widgets", function_widgets
+    )
+
+    viewer = make_napari_viewer()
+    menu = viewer.window.plugins_menu
+    menu._ensure_built()
+
+    def plugin_actions():
+        actions = menu.actions()
+        for cnt, action in enumerate(actions):
+            if action.text() == "":
+                # this is the separator
+                break
+        return actions[cnt + 1 :]
+
+    expected_text = ['Mixed: W1', 'Both', 'Mixed', 'Both']
+    actions = plugin_actions()
+    assert [a.text() for a in actions] == expected_text
+    assert not actions[0].menu()
+    assert [a.text() for a in actions[1].menu().actions()] == ['W1', 'W2']
+    assert [a.text() for a in actions[2].menu().actions()] == ['f1', 'f2']
+    assert [a.text() for a in actions[3].menu().actions()] == ['f1', 'f2']
+
+    # rebuilding keeps the same items
+    menu._build()
+    assert [a.text() for a in plugin_actions()] == expected_text
+
+    # the top level dock widget action still works
+    plugin_actions()[0].trigger()
+    assert 'Mixed: W1' in viewer.window._dock_widgets
+
+
 def test_making_plugin_dock_widgets(test_plugin_widgets, make_napari_viewer):
     """Test that we can create dock widgets, and they get the viewer."""
     viewer = make_napari_viewer()
+    viewer.window.plugins_menu._ensure_built()
     # only take the plugin actions
     actions = viewer.window.plugins_menu.actions()
     for cnt, action in enumerate(actions):
@@ -144,6 +192,7 @@ def test_making_function_dock_widgets(test_plugin_widgets, make_napari_viewer):
     import magicgui
 
     viewer = make_napari_viewer()
+    viewer.window.plugins_menu._ensure_built()
     # only take the plugin actions
     actions = viewer.window.plugins_menu.actions()
     for cnt, action in enumerate(actions):
@@ -170,3 +219,187 @@ def test_making_function_dock_widgets(test_plugin_widgets, make_napari_viewer):
     assert isinstance(magic_widget(), napari.Viewer)
     # Add twice is ok, only does a show
     actions[2].trigger()
+
+
+def test_plugin_widgets_menu_registration(
+    napari_plugin_manager, make_napari_viewer
+):
+    """Test that plugins registered later update the plugins menu."""
+    viewer = make_napari_viewer()
+    menu = viewer.window.plugins_menu
+    menu._ensure_built()
+
+    class Plugin:
+        @napari_hook_implementation
+        def napari_experimental_provide_dock_widget():
+            return [Widg1, Widg2]
+
+    napari_plugin_manager.register(Plugin, name='TestP4')
+    actions = [a for a in menu.actions() if a.text() == 'TestP4']
+    assert len(actions) == 1
+    assert actions[0].menu()
+    subnames = ['Widg1', 'Widg2']
+    assert [a.text() for a in actions[0].menu().actions()] == subnames
+
+    # a rebuild reuses the existing submenu instead of adding another one
+    menu._build()
+    assert [a.text() for a in menu.actions()].count('TestP4') == 1
+
+    napari_plugin_manager.unregister('TestP4')
+    assert 'TestP4' not in [a.text() for a in menu.actions()]
+
+    # a plugin providing a dock widget and several functions gets both a
+    # top level item and a submenu
+    def magicfunc2(viewer: 'napari.Viewer'):
+        return viewer
+
+    class MixedPlugin:
+        @napari_hook_implementation
+        def napari_experimental_provide_dock_widget():
+            return Widg1
+
+        @napari_hook_implementation
+        def napari_experimental_provide_function():
+            return [magicfunc, magicfunc2]
+
+    napari_plugin_manager.register(MixedPlugin, name='TestP5')
+    texts = [a.text() for a in menu.actions()]
+    assert 'TestP5: Widg1' in texts
+    actions = [a for a in menu.actions() if a.text() == 'TestP5']
+    assert len(actions) == 1
+    subnames = ['magicfunc', 'magicfunc2']
+    assert [a.text() for a in actions[0].menu().actions()] == subnames
+
+
+def test_plugin_widgets_menu_toggle_action(
+    napari_plugin_manager, make_napari_viewer
+):
+    """Test menu items swapped for dock toggle actions survive rebuilds."""
+    viewer = make_napari_viewer()
+    menu = viewer.window.plugins_menu
+    menu._ensure_built()
+
+    class Plugin:
+        @napari_hook_implementation
+        def napari_experimental_provide_dock_widget():
+            return [Widg1, Widg2]
+
+    napari_plugin_manager.register(Plugin, name='TestP7')
+    submenu = [a for a in menu.actions() if a.text() == 'TestP7'][0].menu()
+    submenu.actions()[0].trigger()
+    dock_widget = viewer.window._dock_widgets['TestP7: Widg1']
+    toggle_action = dock_widget.toggleViewAction()
+    assert submenu.actions()[0] is toggle_action
+
+    # rebuilding does not add the original menu item back
+    menu._build()
+    assert [a.text() for a in submenu.actions()] == ['TestP7: Widg1', 'Widg2']
+
+    # a widget that is no longer provided loses its toggle action too
+    del napari_plugin_manager._dock_widgets['TestP7']['Widg1']
+    menu._build()
+    texts = [a.text() for a in menu.actions()]
+    assert 'TestP7: Widg2' in texts
+    assert 'TestP7: Widg1' not in texts
+    assert toggle_action not in menu.actions()
+
+
+def test_plugin_widgets_menu_lazy(test_plugin_widgets, make_napari_viewer):
+    """Test the plugin widgets are only added once the menu is shown."""
+    viewer = make_napari_viewer()
+    menu = viewer.window.plugins_menu
+    assert not menu._built
+    n_actions = len(menu.actions())
+
+    menu.aboutToShow.emit()
+    assert menu._built
+    assert len(menu.actions()) == n_actions + 3
+
+    # showing the menu again does not add anything
+    menu.aboutToShow.emit()
+    assert len(menu.actions()) == n_actions + 3
+
+
+def test_plugin_widgets_menu_register_during_build(
+    monkeypatch, napari_plugin_manager, make_napari_viewer
+):
+    """Test plugins registering during a build trigger a single rebuild."""
+    viewer = make_napari_viewer()
+    menu = viewer.window.plugins_menu
+    menu._ensure_built()
+
+    class Plugin:
+        @napari_hook_implementation
+        def napari_experimental_provide_dock_widget():
+            return [Widg1, Widg2]
+
+    # register the plugin once the widgets of the first pass are listed
+    iter_widgets = napari_plugin_manager.iter_widgets
+    passes = []
+
+    def registering_iter_widgets():
+        widgets = list(iter_widgets())
+        if not passes:
+            napari_plugin_manager.register(Plugin, name='TestP6')
+        passes.append(True)
+        return iter(widgets)
+
+    monkeypatch.setattr(
+        napari_plugin_manager, 'iter_widgets', registering_iter_widgets
+    )
+
+    # make sure the build does not re-enter itself
+    build = menu._build
+    depth = []
+
+    def checked_build(event=None):
+        assert not depth
+        depth.append(True)
+        try:
+            build(event)
+        finally:
+            depth.pop()
+
+    monkeypatch.setattr(menu, '_build', checked_build)
+
+    menu._build()
+    # the first pass misses the plugin, exactly one more picks it up
+    assert len(passes) == 2
+    actions = [a for a in menu.actions() if a.text() == 'TestP6']
+    assert len(actions) == 1
+    subnames = ['Widg1', 'Widg2']
+    assert [a.text() for a in actions[0].menu().actions()] == subnames
+
+
+def test_plugin_widgets_menu_failed_build(
+    monkeypatch, napari_plugin_manager, make_napari_viewer
+):
+    """Test plugin events are only connected once the menu is built."""
+    viewer = make_napari_viewer()
+    menu = viewer.window.plugins_menu
+    emitters = (
+        napari_plugin_manager.events.registered,
+        napari_plugin_manager.events.unregistered,
+        napari_plugin_manager.events.disabled,
+    )
+
+    def n_connected(emitter):
+        return sum(
+            isinstance(cb, tuple) and cb[0]() is menu
+            for cb in emitter.callbacks
+        )
+
+    def broken_iter_widgets():
+        raise RuntimeError("broken plugin")
+
+    with monkeypatch.context() as m:
+        m.setattr(napari_plugin_manager, 'iter_widgets', broken_iter_widgets)
+        with pytest.raises(RuntimeError):
+            menu._ensure_built()
+    assert not menu._built
+    assert [n_connected(emitter) for emitter in emitters] == [0, 0, 0]
+
+    # the next attempt builds the menu and connects the events once
+    menu._ensure_built()
+    assert menu._built
+    assert [n_connected(emitter) for emitter in emitters] == [1, 1, 1]
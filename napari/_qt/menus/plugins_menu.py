@@ -1,10 +1,12 @@
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Tuple
 
 from qtpy.QtWidgets import QAction, QMenu
 
 from ...utils.translations import trans
 from ..dialogs.qt_plugin_dialog import QtPluginDialog
 from ..dialogs.qt_plugin_report import QtPluginErrReporter
+from ..utils import qt_signals_blocked
 
 if TYPE_CHECKING:
     from ..qt_main_window import Window
@@ -15,9 +17,39 @@ class PluginsMenu(QMenu):
         self._win = window
         super().__init__(trans._('&Plugins'), window._qt_window)
 
+        # QActions (and multi-widget submenus) are kept around between
+        # rebuilds so that they are only created once per plugin widget.
+        # Actions are keyed by (hook_type, plugin_name, widget_name) and
+        # submenus by (hook_type, plugin_name), as a plugin may provide both
+        # dock and function widgets.
+        self._action_cache: Dict[Tuple[str, str, str], QAction] = {}
+        self._submenu_cache: Dict[Tuple[str, str], QMenu] = {}
+        # plugins are only imported, and their widgets discovered, the first
+        # time the menu is opened (or a plugin widget is added).
+        self._built = False
+
+        action = self.addAction(trans._("Install/Uninstall Plugins..."))
+        action.triggered.connect(self._show_plugin_install_dialog)
+        action = self.addAction(trans._("Plugin Errors..."))
+        action.setStatusTip(
+            trans._(
+                'Review stack traces for plugin exceptions and notify developers'
+            )
+        )
+        action.triggered.connect(self._show_plugin_err_reporter)
+        self.addSeparator()
+        self.aboutToShow.connect(self._ensure_built)
+
+    def _ensure_built(self):
+        """Discover plugin widgets and build the menu, if not done yet."""
+        if self._built:
+            return
         from ...plugins import plugin_manager
 
         plugin_manager.discover_widgets()
+        self._build()
+        # only connect once the build succeeded, so that a failed attempt
+        # (e.g. a broken plugin) doesn't leave duplicate connections behind
         plugin_manager.events.disabled.connect(
             self._remove_unregistered_widget
         )
@@ -25,92 +57,198 @@ class PluginsMenu(QMenu):
         plugin_manager.events.unregistered.connect(
             self._remove_unregistered_widget
         )
-        self._build()
+        self._built = True
+        self.aboutToShow.disconnect(self._ensure_built)
 
     def _build(self, event=None):
-        from ...plugins import menu_item_template, plugin_manager
+        from ...plugins import plugin_manager
 
-        self.clear()
-        action = self.addAction(trans._("Install/Uninstall Plugins..."))
-        action.triggered.connect(self._show_plugin_install_dialog)
-        action = self.addAction(trans._("Plugin Errors..."))
-        action.setStatusTip(
-            trans._(
-                'Review stack traces for plugin exceptions and notify developers'
+        # plugins registering while the menu is being built are picked up
+        # by one more pass afterwards, instead of re-entering the build
+        while True:
+            blocker = plugin_manager.events.registered.blocker(
+                self._add_registered_widget
             )
-        )
-        action.triggered.connect(self._show_plugin_err_reporter)
-        self.addSeparator()
+            with blocker, qt_signals_blocked(self):
+                self._sync_actions(plugin_manager)
+            if not blocker.count:
+                break
+
+    def _sync_actions(self, plugin_manager):
+        """Create, reuse or remove the menu items of all plugin widgets."""
+        all_widgets = list(plugin_manager.iter_widgets())
+        # submenus of plugins that no longer provide multiple widgets
+        multi = {
+            (hook_type, name)
+            for hook_type, (name, wdgs) in all_widgets
+            if len(wdgs) > 1
+        }
+        for menu_key in list(self._submenu_cache):
+            if menu_key not in multi:
+                self._drop_submenu(menu_key)
 
+        current = set()
         # Add a menu item (QAction) for each available plugin widget
-        for hook_type, (plugin_name, widgets) in plugin_manager.iter_widgets():
-            multiprovider = len(widgets) > 1
-            if multiprovider:
+        for hook_type, (plugin_name, widgets) in all_widgets:
+            self._add_plugin_actions(plugin_name, hook_type, widgets)
+            current.update((hook_type, plugin_name, wdg) for wdg in widgets)
+
+        # remove actions for widgets that are no longer provided
+        for key in list(self._action_cache):
+            if key not in current:
+                self._drop_action(key)
+
+    def _add_plugin_actions(self, plugin_name: str, hook_type: str, widgets):
+        """Add (or reuse) the menu items for the widgets of one plugin.
+
+        Parameters
+        ----------
+        plugin_name : str
+            Name of the plugin providing the widgets.
+        hook_type : str
+            Either ``'dock'`` or ``'func'``.
+        widgets : dict
+            Mapping of widget name to widget, as stored by the plugin manager.
+        """
+        from ...plugins import menu_item_template
+
+        menu_key = (hook_type, plugin_name)
+        multiprovider = len(widgets) > 1
+        if multiprovider:
+            menu = self._submenu_cache.get(menu_key)
+            if menu is None:
+                # cached actions were top-level items, text must change
+                for key in list(self._action_cache):
+                    if key[:2] == menu_key:
+                        self._drop_action(key)
                 menu = QMenu(plugin_name, self)
+                self._submenu_cache[menu_key] = menu
                 self.addMenu(menu)
-            else:
-                menu = self
+        else:
+            menu = self
 
-            for wdg_name in widgets:
-                key = (plugin_name, wdg_name)
+        existing = set(menu.actions())
+        for wdg_name in widgets:
+            key = (hook_type, plugin_name, wdg_name)
+            action = self._action_cache.get(key)
+            if action is None:
                 if multiprovider:
                     action = QAction(wdg_name, parent=self)
                 else:
-                    full_name = menu_item_template.format(*key)
+                    full_name = menu_item_template.format(
+                        plugin_name, wdg_name
+                    )
                     action = QAction(full_name, parent=self)
 
-                def _add_widget(*args, key=key, hook_type=hook_type):
-                    if hook_type == 'dock':
-                        self._win.add_plugin_dock_widget(*key)
-                    else:
-                        self._win._add_plugin_function_widget(*key)
-
                 action.setCheckable(True)
-                # check that this wasn't added to the menu already
-                actions = [a.text() for a in menu.actions()]
-                if action.text() not in actions:
-                    menu.addAction(action)
-                action.triggered.connect(_add_widget)
+                # connected once per QAction, cached actions keep it
+                action.triggered.connect(
+                    partial(
+                        self._invoke_widget, plugin_name, wdg_name, hook_type
+                    )
+                )
+                self._action_cache[key] = action
+
+            # check that this wasn't added to the menu already. Compare the
+            # actions themselves: a swapped in toggle action has another text
+            if action not in existing:
+                menu.addAction(action)
+                existing.add(action)
+
+    def _invoke_widget(
+        self, plugin_name: str, wdg_name: str, hook_type: str, *args
+    ):
+        """Add the widget ``wdg_name`` of ``plugin_name`` to the window."""
+        if hook_type == 'dock':
+            self._win.add_plugin_dock_widget(plugin_name, wdg_name)
+        else:
+            self._win._add_plugin_function_widget(plugin_name, wdg_name)
+
+    def _drop_submenu(self, menu_key: Tuple[str, str]):
+        """Remove the (hook_type, plugin_name) submenu, if any, and free it."""
+        menu = self._submenu_cache.get(menu_key)
+        if menu is None:
+            return
+        # the cached actions lived in this submenu, make sure they are
+        # re-created (with the right text) on the next build.
+        for key in [k for k in self._action_cache if k[:2] == menu_key]:
+            self._drop_action(key)
+        del self._submenu_cache[menu_key]
+        self.removeAction(menu.menuAction())
+        menu.deleteLater()
+
+    def _drop_action(self, key: Tuple[str, str, str]):
+        """Remove the cached QAction for ``key`` from its menu and free it."""
+        action = self._action_cache.pop(key)
+        self._submenu_cache.get(key[:2], self).removeAction(action)
+        # toggle actions swapped in by the window belong to their dock widget
+        if action.parent() is self:
+            action.deleteLater()
+
+    def _replace_action(self, name: str, new_action: QAction) -> bool:
+        """Replace the menu item of plugin widget ``name`` by ``new_action``.
+
+        The window uses this to swap the item of a plugin widget for the
+        toggle action of the dock widget it was added to.
+
+        Parameters
+        ----------
+        name : str
+            Full name of the plugin widget, e.g. ``'plugin: widget'``.
+        new_action : QAction
+            Action taking the place of the current menu item.
+
+        Returns
+        -------
+        bool
+            Whether the menu has an item for ``name``.
+        """
+        if not self._action_cache:
+            return False
+        from ...plugins import menu_item_template
+
+        for key, old_action in self._action_cache.items():
+            if menu_item_template.format(*key[1:]) != name:
+                continue
+            if old_action is not new_action:
+                menu = self._submenu_cache.get(key[:2], self)
+                menu.insertAction(old_action, new_action)
+                menu.removeAction(old_action)
+                self._action_cache[key] = new_action
+                if old_action.parent() is self:
+                    old_action.deleteLater()
+            return True
+        return False
 
     def _remove_unregistered_widget(self, event=None):
+        for hook_type in ('dock', 'func'):
+            self._drop_submenu((hook_type, event.value))
+        for key in [k for k in self._action_cache if k[1] == event.value]:
+            self._drop_action(key)
 
-        for idx, action in enumerate(self.actions()):
+        for action in self.actions():
             if event.value in action.text():
                 self.removeAction(action)
-                self._win._remove_dock_widget(event=event)
+        self._win._remove_dock_widget(event=event)
 
     def _add_registered_widget(self, event=None):
-        from ...plugins import menu_item_template, plugin_manager
+        from ...plugins import plugin_manager
 
-        for hook_type, (plugin_name, widgets) in plugin_manager.iter_widgets():
-            if event.value == plugin_name:
-                multiprovider = len(widgets) > 1
-                if multiprovider:
-                    menu = QMenu(plugin_name, self)
-                    self.addMenu(menu)
-                else:
-                    menu = self
-
-                for wdg_name in widgets:
-                    key = (plugin_name, wdg_name)
-                    if multiprovider:
-                        action = QAction(wdg_name, parent=self)
-                    else:
-                        full_name = menu_item_template.format(*key)
-                        action = QAction(full_name, parent=self)
-
-                    def _add_widget(*args, key=key, hook_type=hook_type):
-                        if hook_type == 'dock':
-                            self._win.add_plugin_dock_widget(*key)
-                        else:
-                            self._win._add_plugin_function_widget(*key)
-
-                    action.setCheckable(True)
-                    # check that this wasn't added to the menu already
-                    actions = [a.text() for a in menu.actions()]
-                    if action.text() not in actions:
-                        menu.addAction(action)
-                    action.triggered.connect(_add_widget)
+        plugin_name = event.value
+        blocker = plugin_manager.events.registered.blocker(
+            self._add_registered_widget
+        )
+        with blocker, qt_signals_blocked(self):
+            for hook_type, registry in (
+                ('dock', plugin_manager._dock_widgets),
+                ('func', plugin_manager._function_widgets),
+            ):
+                widgets = registry.get(plugin_name)
+                if widgets:
+                    self._add_plugin_actions(plugin_name, hook_type, widgets)
+
+        if blocker.count:
+            self._build()
 
     def _show_plugin_install_dialog(self):
         """Show dialog that allows users to sort the call order of plugins."""
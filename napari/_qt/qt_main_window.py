@@ -643,6 +643,9 @@ class Window:
         """
         from ..viewer import Viewer
 
+        # make sure the menu item exists so that it can be swapped for the
+        # dock widget's toggle action
+        self.plugins_menu._ensure_built()
         Widget, dock_kwargs = plugin_manager.get_widget(
             plugin_name, widget_name
         )
@@ -692,6 +695,7 @@ class Window:
             specified plugin provides only a single widget, that widget will be
             returned, otherwise a ValueError will be raised, by default None
         """
+        self.plugins_menu._ensure_built()
         full_name = plugin_menu_item_template.format(plugin_name, widget_name)
         if full_name in self._dock_widgets:
             self._dock_widgets[full_name].show()
@@ -854,41 +858,12 @@ class Window:
 
         # dock widgets can have a menu item on the window menu or the plugin menu.
 
-        # check for plugins menu first.  Need to check submenus too.  If the action in the
-        # plugin menu is toggled for the first time, it will be replaced with the toggleViewAction
-        # directly in the plugins menu.
-        actions = [a.text() for a in self.plugins_menu.actions()]
-        if dock_widget.name in actions:
-            idx = actions.index(dock_widget.name)
-            old_action = self.plugins_menu.actions()[idx]
+        # check for plugins menu first.  If the action in the plugin menu (or
+        # one of its submenus) is toggled for the first time, it will be
+        # replaced with the toggleViewAction directly in the plugins menu.
+        if self.plugins_menu._replace_action(dock_widget.name, action):
             dock_widget.setVisible(True)
-            self.plugins_menu.insertAction(old_action, action)
-            self.plugins_menu.removeAction(old_action)
             return
-        else:
-            # if the action is not here, it may be in a submenu
-            for cnt, current_action in enumerate(self.plugins_menu.actions()):
-                if current_action.menu() is not None:
-                    sub_actions = [
-                        plugin_menu_item_template.format(
-                            current_action.text(), a.text()
-                        )
-                        for a in current_action.menu().actions()
-                    ]
-                    if dock_widget.name in sub_actions:
-                        idx = sub_actions.index(dock_widget.name)
-                        old_action = (
-                            self.plugins_menu.actions()[cnt]
-                            .menu()
-                            .actions()[idx]
-                        )
-                        self.plugins_menu.actions()[cnt].menu().insertAction(
-                            old_action, action
-                        )
-                        self.plugins_menu.actions()[cnt].menu().removeAction(
-                            old_action
-                        )
-                        return
 
         self.window_menu.addAction(action)
 
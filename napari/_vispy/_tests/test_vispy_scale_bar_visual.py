@@ -1,4 +1,5 @@
 """Test scale bar."""
+import numpy as np
 import pytest
 from pint import UndefinedUnitError
 
@@ -74,3 +75,122 @@ def test_vispy_text_visual(make_napari_viewer):
     viewer.scale_bar.visible = False
     viewer.scale_bar.unit = "pixel"
     assert qt_widget.scale_bar._quantity.units == "pixel"
+
+
+def test_vispy_scale_bar_best_length(make_napari_viewer):
+    viewer = make_napari_viewer()
+    scale_bar = viewer.window.qt_viewer.scale_bar
+    viewer.scale_bar.visible = True
+
+    viewer.scale_bar.unit = "um"
+    length, quantity = scale_bar._calculate_best_length(150)
+    assert length == 125
+    assert quantity.magnitude == 125
+    assert quantity.units == "micrometer"
+
+    # lengths are converted to a more compact unit
+    length, quantity = scale_bar._calculate_best_length(1234)
+    assert length == 1000
+    assert quantity.magnitude == 1
+    assert quantity.units == "millimeter"
+
+    # the magnitude of the scale bar unit is taken into account
+    viewer.scale_bar.unit = "12um"
+    length, quantity = scale_bar._calculate_best_length(150)
+    assert length == pytest.approx(1000 / 12)
+    assert quantity.magnitude == 1
+    assert quantity.units == "millimeter"
+
+
+def test_vispy_scale_bar_color(make_napari_viewer):
+    viewer = make_napari_viewer()
+    scale_bar = viewer.window.qt_viewer.scale_bar
+    viewer.scale_bar.visible = True
+
+    viewer.theme = 'dark'
+    dark_color = scale_bar.text_node.color.rgba[0]
+    viewer.theme = 'light'
+    light_color = scale_bar.text_node.color.rgba[0]
+    assert not np.array_equal(dark_color, light_color)
+    # the color is the inverse of the (white) light theme canvas
+    np.testing.assert_array_equal(light_color, [0, 0, 0, 1])
+
+    viewer.scale_bar.colored = True
+    np.testing.assert_array_equal(
+        scale_bar.text_node.color.rgba[0], [1, 0, 1, 1]
+    )
+    viewer.scale_bar.colored = False
+    np.testing.assert_array_equal(
+        scale_bar.text_node.color.rgba[0], light_color
+    )
+
+    # toggling ticks keeps the color
+    viewer.scale_bar.ticks = False
+    np.testing.assert_array_equal(
+        scale_bar.text_node.color.rgba[0], light_color
+    )
+    viewer.theme = 'dark'
+    np.testing.assert_array_equal(
+        scale_bar.text_node.color.rgba[0], dark_color
+    )
+
+
+def test_vispy_scale_bar_position(make_napari_viewer):
+    viewer = make_napari_viewer()
+    scale_bar = viewer.window.qt_viewer.scale_bar
+    viewer.scale_bar.visible = True
+    width, height = scale_bar.node.canvas.size
+
+    for position, translate, sign in [
+        (Position.TOP_LEFT, [10, 10], 1),
+        (Position.TOP_RIGHT, [width - 10, 10], -1),
+        (Position.BOTTOM_RIGHT, [width - 10, height - 30], -1),
+        (Position.BOTTOM_LEFT, [10, height - 30], 1),
+    ]:
+        viewer.scale_bar.position = position
+        transform = scale_bar.node.transform
+        np.testing.assert_array_equal(transform.translate[:2], translate)
+        assert np.sign(transform.scale[0]) == sign
+
+
+def test_vispy_scale_bar_hidden(make_napari_viewer):
+    viewer = make_napari_viewer()
+    scale_bar = viewer.window.qt_viewer.scale_bar
+    viewer.scale_bar.visible = True
+    viewer.camera.zoom = 1
+    text = scale_bar.text_node.text
+
+    # a hidden scale bar doesn't follow the zoom or ticks...
+    viewer.scale_bar.visible = False
+    viewer.camera.zoom = 0.01
+    viewer.scale_bar.ticks = False
+    assert scale_bar.text_node.text == text
+    assert len(scale_bar.node._pos) == 6
+
+    # ...but is updated when shown again
+    viewer.scale_bar.visible = True
+    assert scale_bar.text_node.text != text
+    assert len(scale_bar.node._pos) == 2
+
+
+def test_vispy_scale_bar_color_theme_updated(make_napari_viewer):
+    from napari.utils.theme import get_theme, register_theme
+
+    viewer = make_napari_viewer()
+    scale_bar = viewer.window.qt_viewer.scale_bar
+    viewer.scale_bar.visible = True
+    viewer.theme = 'dark'
+
+    # register an updated theme under the same name
+    original = get_theme('dark', False)
+    theme = original.dict()
+    theme['canvas'] = 'white'
+    register_theme('dark', theme)
+    try:
+        # any event updating the data picks up the new canvas color
+        viewer.scale_bar.ticks = False
+        np.testing.assert_array_equal(
+            scale_bar.text_node.color.rgba[0], [0, 0, 0, 1]
+        )
+    finally:
+        register_theme('dark', original)
@@ -1,5 +1,5 @@
 """Scale Bar visual."""
-import bisect
+from functools import lru_cache
 
 import numpy as np
 from vispy.scene.visuals import Line, Text
@@ -7,10 +7,79 @@ from vispy.visuals.transforms import STTransform
 
 from ..components._viewer_constants import Position
 from ..utils._units import PREFERRED_VALUES, get_unit_registry
-from ..utils.colormaps.standardize_color import transform_color
 from ..utils.theme import get_theme
 from ..utils.translations import trans
 
+# sorted array of the preferred values, for fast lookups with `searchsorted`
+_PREFERRED_VALUES_ARRAY = np.asarray(PREFERRED_VALUES, dtype=np.float64)
+# zoom changes within these ratios (i.e. 1e-4 in log10 space) are ignored
+_MIN_SCALE_RATIO = 10 ** -1e-4
+_MAX_SCALE_RATIO = 10 ** 1e-4
+
+# line segments of the scale bar, the first one is the bar itself and the
+# others are the ticks at both of its ends
+_SCALE_BAR_DATA = np.array(
+    [
+        [0, 0, -1],
+        [1, 0, -1],
+        [0, -5, -1],
+        [0, 5, -1],
+        [1, -5, -1],
+        [1, 5, -1],
+    ]
+)
+_SCALE_BAR_DATA.setflags(write=False)
+_SCALE_BAR_DATA_NO_TICKS = _SCALE_BAR_DATA[:2]
+_DEFAULT_COLOR = np.array([1, 0, 1, 1])
+_DEFAULT_COLOR.setflags(write=False)
+
+# offset (x, y) of the scale bar from the edges of the canvas
+_BAR_OFFSET = (10, 30)
+# for each position, the sign of the bar's x scale and a function mapping
+# canvas (width, height) and bar offset (x, y) to the bar's (x, y) translation
+_POSITION_TRANSFORMS = {
+    Position.TOP_LEFT: (1, lambda w, h, x, y: (x, 10)),
+    Position.TOP_RIGHT: (-1, lambda w, h, x, y: (w - x, 10)),
+    Position.BOTTOM_RIGHT: (-1, lambda w, h, x, y: (w - x, h - y)),
+    Position.BOTTOM_LEFT: (1, lambda w, h, x, y: (x, h - y)),
+}
+
+
+@lru_cache(maxsize=256)
+def _best_length(desired_length: float, magnitude: float, units):
+    """Calculate the preferred length and quantity of the scale bar.
+
+    See :meth:`VispyScaleBarVisual._calculate_best_length`, the quantity of
+    the scale bar is given by its ``magnitude`` and pint ``units`` so that the
+    result can be cached.
+    """
+    quantity = magnitude * units
+    current_quantity = quantity * desired_length
+    # convert the value to compact representation
+    new_quantity = current_quantity.to_compact()
+    # calculate the scaling factor taking into account any conversion
+    # that might have occurred (e.g. um -> cm)
+    factor = current_quantity / new_quantity
+
+    # select value closest to one of our preferred values
+    index = int(
+        np.searchsorted(
+            _PREFERRED_VALUES_ARRAY,
+            float(new_quantity.magnitude),
+            side='left',
+        )
+    )
+    if index > 0:
+        # When we get the lowest index of the list, removing -1 will
+        # return the last index.
+        index -= 1
+    new_value = PREFERRED_VALUES[index]
+
+    # get the new pixel length utilizing the user-specified units
+    new_length = ((new_value * factor) / quantity.magnitude).magnitude
+    new_quantity = new_value * new_quantity.units
+    return new_length, new_quantity
+
 
 class VispyScaleBarVisual:
     """Scale bar in world coordinates."""
@@ -18,27 +87,29 @@ class VispyScaleBarVisual:
     def __init__(self, viewer, parent=None, order=0):
         self._viewer = viewer
 
-        self._data = np.array(
-            [
-                [0, 0, -1],
-                [1, 0, -1],
-                [0, -5, -1],
-                [0, 5, -1],
-                [1, -5, -1],
-                [1, 5, -1],
-            ]
-        )
-        self._default_color = np.array([1, 0, 1, 1])
+        self._data = _SCALE_BAR_DATA
+        # views of the line data with and without the ticks at both ends
+        self._data_with_ticks = _SCALE_BAR_DATA
+        self._data_no_ticks = _SCALE_BAR_DATA_NO_TICKS
+        self._default_color = _DEFAULT_COLOR
         self._target_length = 150
         self._scale = 1
         self._quantity = None
         self._unit_reg = None
+        # color of the scale bar for the last (colored, canvas color) pair
+        self._cached_color_key = None
+        self._cached_color = None
+        # (ticks, color key) of the data last sent to the nodes
+        self._last_upload = None
 
         self.node = Line(
             connect='segments', method='gl', parent=parent, width=3
         )
         self.node.order = order
         self.node.transform = STTransform()
+        # reused to update the transform without allocating new lists
+        self._scale_buf = np.ones(4)
+        self._translate_buf = np.zeros(4)
 
         # In order for the text to always appear centered on the scale bar,
         # the text node should use the line node as the parent.
@@ -48,6 +119,8 @@ class VispyScaleBarVisual:
         self.text_node.font_size = 10
         self.text_node.anchors = ("center", "center")
         self.text_node.text = f"{1}px"
+        # (magnitude, units) of the quantity shown by the text node
+        self._last_text_key = None
 
         # Note:
         # There are issues on MacOS + GitHub action about destroyed
@@ -62,14 +135,13 @@ class VispyScaleBarVisual:
         assert self.node.canvas is self.text_node.canvas
         # End Note
 
-        self._viewer.events.theme.connect(self._on_data_change)
+        # zoom, theme, colored and ticks events are only connected while
+        # the scale bar is visible, see `_on_visible_change`
+        self._connected = False
         self._viewer.scale_bar.events.visible.connect(self._on_visible_change)
-        self._viewer.scale_bar.events.colored.connect(self._on_data_change)
-        self._viewer.scale_bar.events.ticks.connect(self._on_data_change)
         self._viewer.scale_bar.events.position.connect(
             self._on_position_change
         )
-        self._viewer.camera.events.zoom.connect(self._on_zoom_change)
         self._viewer.scale_bar.events.font_size.connect(self._on_text_change)
         self._viewer.scale_bar.events.unit.connect(self._on_dimension_change)
 
@@ -119,27 +191,12 @@ class VispyScaleBarVisual:
         new_quantity : pint.Quantity
             New quantity with abbreviated base unit.
         """
-        current_quantity = self._quantity * desired_length
-        # convert the value to compact representation
-        new_quantity = current_quantity.to_compact()
-        # calculate the scaling factor taking into account any conversion
-        # that might have occurred (e.g. um -> cm)
-        factor = current_quantity / new_quantity
-
-        # select value closest to one of our preferred values
-        index = bisect.bisect_left(PREFERRED_VALUES, new_quantity.magnitude)
-        if index > 0:
-            # When we get the lowest index of the list, removing -1 will
-            # return the last index.
-            index -= 1
-        new_value = PREFERRED_VALUES[index]
-
-        # get the new pixel length utilizing the user-specified units
-        new_length = (
-            (new_value * factor) / self._quantity.magnitude
-        ).magnitude
-        new_quantity = new_value * new_quantity.units
-        return new_length, new_quantity
+        # nearby lengths (almost) always give the same result, so they are
+        # quantized to share the cached pint calculations
+        desired_length = float(f'{desired_length:.4g}')
+        return _best_length(
+            desired_length, self._quantity.magnitude, self._quantity.units
+        )
 
     def _on_zoom_change(self, event, force: bool = False):
         """Update axes length based on zoom scale."""
@@ -148,7 +205,11 @@ class VispyScaleBarVisual:
 
         # If scale has not changed, do not redraw
         scale = 1 / self._viewer.camera.zoom
-        if abs(np.log10(self._scale) - np.log10(scale)) < 1e-4 and not force:
+        if (
+            not force
+            and self._scale
+            and _MIN_SCALE_RATIO < scale / self._scale < _MAX_SCALE_RATIO
+        ):
             return
         self._scale = scale
 
@@ -166,43 +227,83 @@ class VispyScaleBarVisual:
         )
         scale = target_canvas_pixels_rounded
 
-        sign = (
-            -1
-            if self._viewer.scale_bar.position
-            in [Position.TOP_RIGHT, Position.BOTTOM_RIGHT]
-            else 1
-        )
-
-        # Update scalebar and text
-        self.node.transform.scale = [sign * scale, 1, 1, 1]
-        self.text_node.text = f'{new_dim:~}'
+        sign = _POSITION_TRANSFORMS[self._viewer.scale_bar.position][0]
+
+        # Update scalebar and text, notifying listeners only once per node
+        node_blocker = self.node.events.update.blocker()
+        text_blocker = self.text_node.events.update.blocker()
+        with node_blocker, text_blocker:
+            self._scale_buf[0] = sign * scale
+            self.node.transform.scale = self._scale_buf
+            # formatting pint quantities is slow, only do it on changes
+            text_key = (new_dim.magnitude, new_dim.units)
+            if text_key != self._last_text_key:
+                self._last_text_key = text_key
+                self.text_node.text = f'{new_dim:~}'
+        self.node.update()
+        self.text_node.update()
 
     def _on_data_change(self, event):
         """Change color and data of scale bar."""
+        # key on the canvas color itself rather than the theme name, as a
+        # theme can be registered again under the same name
         if self._viewer.scale_bar.colored:
+            key = (True, None)
+        else:
+            # RGB values are integers in 0-255 and alpha a float in 0-1
+            canvas = get_theme(self._viewer.theme, False).canvas
+            key = (False, canvas.as_rgb_tuple(alpha=True))
+
+        if key == self._cached_color_key:
+            color = self._cached_color
+        elif self._viewer.scale_bar.colored:
             color = self._default_color
         else:
-            # the reason for using the `as_hex` here is to avoid
-            # `UserWarning` which is emitted when RGB values are above 1
-            background_color = get_theme(
-                self._viewer.theme, False
-            ).canvas.as_hex()
-            background_color = transform_color(background_color)[0]
-            color = np.subtract(1, background_color)
-            color[-1] = background_color[-1]
-
-        if self._viewer.scale_bar.ticks:
-            data = self._data
+            r, g, b, a = key[1]
+            # invert the RGB channels, keep the alpha of the background
+            color = np.array(
+                [1 - r / 255, 1 - g / 255, 1 - b / 255, a], dtype=np.float32
+            )
+        self._cached_color_key = key
+        self._cached_color = color
+
+        ticks = self._viewer.scale_bar.ticks
+        if (ticks, key) == self._last_upload:
+            return
+        self._last_upload = (ticks, key)
+
+        if ticks:
+            data = self._data_with_ticks
         else:
-            data = self._data[:2]
+            data = self._data_no_ticks
 
         self.node.set_data(data, color)
         self.text_node.color = color
 
+    def _connect_events(self, connect: bool):
+        """Connect or disconnect the events that only a visible bar needs."""
+        for emitter, callback in (
+            (self._viewer.camera.events.zoom, self._on_zoom_change),
+            (self._viewer.events.theme, self._on_data_change),
+            (self._viewer.scale_bar.events.colored, self._on_data_change),
+            (self._viewer.scale_bar.events.ticks, self._on_data_change),
+        ):
+            if connect:
+                emitter.connect(callback)
+            else:
+                emitter.disconnect(callback)
+        self._connected = connect
+
     def _on_visible_change(self, event):
         """Change visibility of scale bar."""
-        self.node.visible = self._viewer.scale_bar.visible
-        self.text_node.visible = self._viewer.scale_bar.visible
+        visible = self._viewer.scale_bar.visible
+        self.node.visible = visible
+        self.text_node.visible = visible
+        if visible != self._connected:
+            self._connect_events(visible)
+            if visible:
+                # catch up with changes made while the bar was hidden
+                self._on_data_change(None)
 
         # update unit if scale bar is visible and quantity
         # has not been specified yet or current unit is not
@@ -222,27 +323,9 @@ class VispyScaleBarVisual:
     def _on_position_change(self, event):
         """Change position of scale bar."""
         position = self._viewer.scale_bar.position
-        x_bar_offset, y_bar_offset = 10, 30
-        canvas_size = list(self.node.canvas.size)
-
-        if position == Position.TOP_LEFT:
-            sign = 1
-            bar_transform = [x_bar_offset, 10, 0, 0]
-        elif position == Position.TOP_RIGHT:
-            sign = -1
-            bar_transform = [canvas_size[0] - x_bar_offset, 10, 0, 0]
-        elif position == Position.BOTTOM_RIGHT:
-            sign = -1
-            bar_transform = [
-                canvas_size[0] - x_bar_offset,
-                canvas_size[1] - y_bar_offset,
-                0,
-                0,
-            ]
-        elif position == Position.BOTTOM_LEFT:
-            sign = 1
-            bar_transform = [x_bar_offset, canvas_size[1] - 30, 0, 0]
-        else:
+        try:
+            sign, get_translate = _POSITION_TRANSFORMS[position]
+        except KeyError:
             raise ValueError(
                 trans._(
                     'Position {position} not recognized.',
@@ -250,8 +333,10 @@ class VispyScaleBarVisual:
                     position=self._viewer.scale_bar.position,
                 )
             )
+        width, height = self.node.canvas.size
+        self._translate_buf[:2] = get_translate(width, height, *_BAR_OFFSET)
+        self._scale_buf[0] = sign * abs(self._scale_buf[0])
 
-        self.node.transform.translate = bar_transform
-        scale = abs(self.node.transform.scale[0])
-        self.node.transform.scale = [sign * scale, 1, 1, 1]
+        self.node.transform.translate = self._translate_buf
+        self.node.transform.scale = self._scale_buf
         self.text_node.transform.translate = (0, 20, 0, 0)